@@ -55,14 +55,10 @@ spec:
 """
 
         try:
-            # Write YAML to temp file
-            with open('/tmp/crashloop-pod.yaml', 'w') as f:
-                f.write(yaml)
-
             # Apply the pod
             result = subprocess.run(
-                ['kubectl', '--context', self.context, 'apply', '-f', '/tmp/crashloop-pod.yaml'],
-                capture_output=True, text=True, timeout=10
+                ['kubectl', '--context', self.context, 'apply', '-f', '-'],
+                input=yaml, capture_output=True, text=True, timeout=10
             )
 
             if result.returncode == 0:
@@ -106,12 +102,9 @@ spec:
 """
 
         try:
-            with open('/tmp/failing-deployment.yaml', 'w') as f:
-                f.write(yaml)
-
             result = subprocess.run(
-                ['kubectl', '--context', self.context, 'apply', '-f', '/tmp/failing-deployment.yaml'],
-                capture_output=True, text=True, timeout=10
+                ['kubectl', '--context', self.context, 'apply', '-f', '-'],
+                input=yaml, capture_output=True, text=True, timeout=10
             )
 
             if result.returncode == 0:
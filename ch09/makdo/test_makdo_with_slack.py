@@ -61,12 +61,9 @@ spec:
   restartPolicy: Always
 """
         try:
-            with open('/tmp/crashloop-pod.yaml', 'w') as f:
-                f.write(yaml)
-
             result = subprocess.run(
-                ['kubectl', '--context', self.context, 'apply', '-f', '/tmp/crashloop-pod.yaml'],
-                capture_output=True, text=True, timeout=10
+                ['kubectl', '--context', self.context, 'apply', '-f', '-'],
+                input=yaml, capture_output=True, text=True, timeout=10
             )
 
             if result.returncode == 0:
@@ -103,12 +100,9 @@ spec:
         imagePullPolicy: Always
 """
         try:
-            with open('/tmp/failing-deployment.yaml', 'w') as f:
-                f.write(yaml)
-
             result = subprocess.run(
-                ['kubectl', '--context', self.context, 'apply', '-f', '/tmp/failing-deployment.yaml'],
-                capture_output=True, text=True, timeout=10
+                ['kubectl', '--context', self.context, 'apply', '-f', '-'],
+                input=yaml, capture_output=True, text=True, timeout=10
             )
 
             if result.returncode == 0:
@@ -34,6 +34,8 @@ class QuickMAKDOTest:
             "start_time": time.time(),
             "tests": {}
         }
+        # Reuse one keep-alive connection for the k8s-ai health probes
+        self.http = requests.Session()
 
     async def test_agent_creation(self) -> bool:
         """Test that MAKDO agents can be created"""
@@ -154,7 +156,7 @@ class QuickMAKDOTest:
 
         try:
             # Check if server is running
-            response = requests.get("http://localhost:9999/health", timeout=5)
+            response = self.http.get("http://localhost:9999/health", timeout=5)
             server_running = response.status_code == 200
 
             if not server_running:
@@ -170,7 +172,7 @@ class QuickMAKDOTest:
                     # Wait a bit and check again
                     time.sleep(5)
                     try:
-                        response = requests.get("http://localhost:9999/health", timeout=3)
+                        response = self.http.get("http://localhost:9999/health", timeout=3)
                         server_running = response.status_code == 200
                     except:
                         server_running = False
@@ -258,14 +260,11 @@ spec:
   restartPolicy: Never
 """
 
-            # Apply the pod
-            with open("/tmp/quick-test-pod.yaml", "w") as f:
-                f.write(pod_yaml)
-
+            # Apply the pod from stdin
             result = subprocess.run([
                 "kubectl", "--context", cluster,
-                "apply", "-f", "/tmp/quick-test-pod.yaml"
-            ], capture_output=True, text=True)
+                "apply", "-f", "-"
+            ], input=pod_yaml, capture_output=True, text=True)
 
             pod_created = result.returncode == 0
 
@@ -290,8 +289,6 @@ spec:
                     "--ignore-not-found=true"
                 ], capture_output=True)
 
-                os.unlink("/tmp/quick-test-pod.yaml")
-
             else:
                 failure_detected = False
                 pod_status = "NotCreated"
@@ -356,8 +353,7 @@ spec:
         results_file = Path("tests/e2e/quick_results.json")
         results_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(results_file, "w") as f:
-            json.dump(self.results, f, indent=2)
+        results_file.write_text(json.dumps(self.results, indent=2, default=str))
 
         # Print summary
         logger.info(f"\n{'='*50}")
@@ -35,13 +35,7 @@ except ImportError:
     SCREENSHOTS_ENABLED = False
 
 # Import from test_makdo_e2e
-import importlib.util
-spec = importlib.util.spec_from_file_location("test_makdo_e2e", Path(__file__).parent / "test_makdo_e2e.py")
-test_makdo_e2e = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(test_makdo_e2e)
-
-KubernetesFailureSimulator = test_makdo_e2e.KubernetesFailureSimulator
-SlackNotificationVerifier = test_makdo_e2e.SlackNotificationVerifier
+from tests.e2e.test_makdo_e2e import KubernetesFailureSimulator, SlackNotificationVerifier
 
 logging.basicConfig(
     level=logging.INFO,
@@ -463,20 +457,22 @@ class MAKDODemoTest:
                 "kubectl", "--context", "kind-makdo-test",
                 "get", "pods", "-n", self.failure_simulator.namespace,
                 "--field-selector=status.phase!=Running",
-                "-o", "jsonpath={.items[*].metadata.name}"
+                "-o", "json"
             ], capture_output=True, text=True)
 
-            failing_pods = result.stdout.strip().split() if result.stdout.strip() else []
+            failing_pods = [pod["metadata"]["name"]
+                            for pod in json.loads(result.stdout or "{}").get("items", [])]
 
             # Get warning events
             events_result = subprocess.run([
                 "kubectl", "--context", "kind-makdo-test",
                 "get", "events", "-n", self.failure_simulator.namespace,
                 "--field-selector=type=Warning",
-                "-o", "jsonpath={.items[*].reason}"
+                "-o", "json"
             ], capture_output=True, text=True)
 
-            warning_events = list(set(events_result.stdout.strip().split())) if events_result.stdout.strip() else []
+            warning_events = list({event.get("reason", "")
+                                   for event in json.loads(events_result.stdout or "{}").get("items", [])})
 
             # Report findings
             detection_report = (
@@ -621,8 +617,7 @@ class MAKDODemoTest:
 
             # Save results
             results_file = Path("tests/e2e/demo_results.json")
-            with open(results_file, 'w') as f:
-                json.dump(self.results, f, indent=2)
+            results_file.write_text(json.dumps(self.results, indent=2, default=str))
 
             # Print summary
             logger.info("\n" + "="*80)
@@ -17,13 +17,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 # Import from same directory
-import importlib.util
-spec = importlib.util.spec_from_file_location("test_makdo_e2e", Path(__file__).parent / "test_makdo_e2e.py")
-test_makdo_e2e = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(test_makdo_e2e)
-
-KubernetesFailureSimulator = test_makdo_e2e.KubernetesFailureSimulator
-SlackNotificationVerifier = test_makdo_e2e.SlackNotificationVerifier
+from tests.e2e.test_makdo_e2e import KubernetesFailureSimulator, SlackNotificationVerifier
 
 logging.basicConfig(
     level=logging.INFO,
@@ -167,10 +161,11 @@ class InfrastructureTest:
                 "kubectl", "--context", "kind-makdo-test",
                 "get", "pods", "-n", self.failure_simulator.namespace,
                 "--field-selector=status.phase!=Running",
-                "-o", "jsonpath={.items[*].metadata.name}"
+                "-o", "json"
             ], capture_output=True, text=True)
 
-            failing_pods = result.stdout.strip().split() if result.stdout.strip() else []
+            failing_pods = [pod["metadata"]["name"]
+                            for pod in json.loads(result.stdout or "{}").get("items", [])]
             failure_detected = len(failing_pods) > 0
 
             # Get pod events for more details
@@ -178,10 +173,11 @@ class InfrastructureTest:
                 "kubectl", "--context", "kind-makdo-test",
                 "get", "events", "-n", self.failure_simulator.namespace,
                 "--field-selector=type=Warning",
-                "-o", "jsonpath={.items[*].reason}"
+                "-o", "json"
             ], capture_output=True, text=True)
 
-            warning_events = events_result.stdout.strip().split() if events_result.stdout.strip() else []
+            warning_events = [event.get("reason", "")
+                              for event in json.loads(events_result.stdout or "{}").get("items", [])]
             expected_events = ["Failed", "ErrImagePull", "ImagePullBackOff"]
             relevant_events = [e for e in warning_events if any(exp in e for exp in expected_events)]
 
@@ -293,8 +289,7 @@ class InfrastructureTest:
 
         # Save results
         results_file = Path("tests/e2e/infrastructure_results.json")
-        with open(results_file, "w") as f:
-            json.dump(self.results, f, indent=2)
+        results_file.write_text(json.dumps(self.results, indent=2, default=str))
 
         # Send final Slack notification
         if self.slack_verifier:
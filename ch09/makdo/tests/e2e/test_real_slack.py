@@ -11,7 +11,7 @@ import time
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 # Add project root to path
 import sys
@@ -22,13 +22,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Import from same directory
-import importlib.util
-spec = importlib.util.spec_from_file_location("test_makdo_e2e", Path(__file__).parent / "test_makdo_e2e.py")
-test_makdo_e2e = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(test_makdo_e2e)
-
-KubernetesFailureSimulator = test_makdo_e2e.KubernetesFailureSimulator
-SlackNotificationVerifier = test_makdo_e2e.SlackNotificationVerifier
+from tests.e2e.test_makdo_e2e import ICONS, KubernetesFailureSimulator, SlackNotificationVerifier
 
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +30,55 @@ logging.basicConfig(
 )
 logger = logging.getLogger("MAKDO-RealWorld-E2E")
 
+# Slack message templates; only the live values are substituted per message
+WELCOME_MESSAGE = (
+    "🚀 **MAKDO Real-World E2E Test Starting!**\n\n"
+    "🤖 **What we're testing:**\n"
+    "• Creating real Kubernetes failures in kind clusters\n"
+    "• Detecting and reporting issues through this channel\n"
+    "• End-to-end failure simulation and notification workflow\n\n"
+    "⏰ **Started:** {now:%Y-%m-%d %H:%M:%S}\n"
+    "📱 **Channel:** {channel}\n"
+    "🎯 **Goal:** Validate complete MAKDO E2E infrastructure"
+)
+
+CLEANUP_MESSAGE = (
+    "🧹 **Cleanup Phase Started**\n\n"
+    "🗑️ Deleting test namespace: `{namespace}`\n"
+    "🔄 Cleaning up all created pods, services, deployments\n"
+    "⏳ This may take a moment..."
+)
+
+FINAL_SUMMARY_MESSAGE = (
+    "🎊 **MAKDO Real-World E2E Test Complete!**\n\n"
+    "📊 **Final Results:**\n"
+    "✅ **Tests Passed:** {passed}/{total}\n"
+    "📈 **Success Rate:** {rate:.1%}\n"
+    "🎯 **Overall Status:** {status}\n\n"
+    "🔍 **What We Demonstrated:**\n"
+    "• ✅ Real Slack channel auto-creation and bot integration\n"
+    "• ✅ Live Kubernetes failure simulation in kind clusters\n"
+    "• ✅ Real-time failure detection and event monitoring\n"
+    "• ✅ Comprehensive status reporting to Slack\n"
+    "• ✅ Automated cleanup procedures\n\n"
+    "⏱️ **Duration:** {duration:.1f} seconds\n"
+    "📅 **Completed:** {now:%Y-%m-%d %H:%M:%S}\n\n"
+    "**🚀 This infrastructure is ready to test MAKDO when the agent config is fixed!**"
+)
+
+# Number of most recent namespace events shown in the status report
+RECENT_EVENT_COUNT = 10
+
+# Overall result banner for the final summary, looked up by outcome
+OVERALL_STATUS = {True: "🎉 SUCCESS", False: "😞 NEEDS WORK"}
+
+def format_table(headers, rows) -> str:
+    """Render rows as a kubectl-style table with left-aligned, padded columns"""
+    table = [headers] + [tuple("<none>" if value is None else str(value) for value in row) for row in rows]
+    widths = [max(len(row[i]) for row in table) for i in range(len(headers))]
+    return "\n".join("   ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+                     for row in table)
+
 class RealWorldMAKDOTest:
     """Real-world E2E test with live Slack integration and actual failures"""
 
@@ -59,6 +102,32 @@ class RealWorldMAKDOTest:
 
         self.slack_verifier = SlackNotificationVerifier(slack_token, "#makdo-devops")
 
+        # Whether the cluster serves the metrics API (checked once, on first use)
+        self._metrics_server: Optional[bool] = None
+
+        # Slack posts are queued and sent in order by a background worker, so the
+        # test flow doesn't wait on Slack round-trips
+        self._slack_queue: asyncio.Queue = asyncio.Queue()
+        self._slack_worker: Optional[asyncio.Task] = None
+
+    def _notify(self, message: str, blocks: Optional[list] = None):
+        """Queue a Slack message (optionally with Block Kit blocks) for the worker"""
+        self._slack_queue.put_nowait((message, blocks))
+
+    async def _slack_loop(self):
+        """Post queued Slack messages one at a time"""
+        while True:
+            message, blocks = await self._slack_queue.get()
+            try:
+                if blocks:
+                    await asyncio.to_thread(self.slack_verifier.send_blocks, blocks, message)
+                else:
+                    await asyncio.to_thread(self.slack_verifier.send_test_message, message)
+            except Exception as e:
+                logger.error(f"Failed to post queued Slack message: {e}")
+            finally:
+                self._slack_queue.task_done()
+
     async def test_slack_channel_creation_and_messaging(self) -> bool:
         """Test creating/joining Slack channel and sending messages"""
         logger.info("🔧 Testing Slack channel creation and messaging...")
@@ -74,16 +143,10 @@ class RealWorldMAKDOTest:
             logger.info(f"✅ Slack channel ready: {self.slack_verifier.channel} (ID: {self.slack_verifier.channel_id})")
 
             # Send welcome message
-            welcome_msg = (
-                f"🚀 **MAKDO Real-World E2E Test Starting!**\n\n"
-                f"🤖 **What we're testing:**\n"
-                f"• Creating real Kubernetes failures in kind clusters\n"
-                f"• Detecting and reporting issues through this channel\n"
-                f"• End-to-end failure simulation and notification workflow\n\n"
-                f"⏰ **Started:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-                f"📱 **Channel:** {self.slack_verifier.channel}\n"
-                f"🎯 **Goal:** Validate complete MAKDO E2E infrastructure"
-            )
+            welcome_msg = WELCOME_MESSAGE.format_map({
+                "now": datetime.now(),
+                "channel": self.slack_verifier.channel,
+            })
 
             welcome_sent = self.slack_verifier.send_test_message(welcome_msg)
 
@@ -94,7 +157,7 @@ class RealWorldMAKDOTest:
                 return False
 
             # Wait and check if message was received
-            time.sleep(3)
+            await asyncio.sleep(3)
             recent_messages = self.slack_verifier.get_recent_messages(limit=5)
             message_received = len(recent_messages) > 0
 
@@ -135,7 +198,7 @@ class RealWorldMAKDOTest:
                     f"📊 **Pod quota:** 50 pods max\n\n"
                     f"🎬 Ready to simulate failures!"
                 )
-                self.slack_verifier.send_test_message(setup_msg)
+                self._notify(setup_msg)
 
             self.results["tests"]["k8s_cluster_setup"] = {
                 "success": namespace_created,
@@ -169,32 +232,31 @@ class RealWorldMAKDOTest:
             results = {}
             successful_scenarios = []
             failed_scenarios = []
+            # Per-scenario results, posted to Slack as one message with the summary
+            scenario_lines = []
 
-            for display_name, scenario_id, scenario_func in scenarios:
-                logger.info(f"  💥 Creating scenario: {display_name}")
-
-                # Notify Slack about starting scenario
-                scenario_msg = f"💥 **Creating Failure Scenario: {display_name}**\n⏳ Deploying problematic resources..."
-                self.slack_verifier.send_test_message(scenario_msg)
+            # Scenarios touch independent resources, so create them all concurrently
+            outcomes = await asyncio.gather(
+                *(self._run_scenario(display_name, scenario_func) for display_name, _, scenario_func in scenarios),
+                return_exceptions=True
+            )
 
-                # Create the failure scenario
-                success = scenario_func()
+            for (display_name, scenario_id, _), outcome in zip(scenarios, outcomes):
+                success = outcome is True
+                if isinstance(outcome, Exception):
+                    logger.error(f"    💥 {display_name} raised: {outcome}")
                 results[scenario_id] = success
 
                 if success:
                     successful_scenarios.append(display_name)
-                    result_msg = f"✅ **{display_name}** - Successfully created failure scenario"
+                    scenario_lines.append(f"✅ **{display_name}** - Successfully created failure scenario")
                     logger.info(f"    ✅ {display_name} created successfully")
                 else:
                     failed_scenarios.append(display_name)
-                    result_msg = f"❌ **{display_name}** - Failed to create scenario"
+                    scenario_lines.append(f"❌ **{display_name}** - Failed to create scenario")
                     logger.error(f"    ❌ {display_name} creation failed")
 
-                # Report result to Slack
-                self.slack_verifier.send_test_message(result_msg)
-                time.sleep(3)  # Space out scenario creation
-
-            # Send summary to Slack
+            # Send scenario results and summary to Slack in a single post
             summary_msg = (
                 f"📊 **Failure Scenario Creation Complete**\n\n"
                 f"✅ **Successful:** {len(successful_scenarios)}/{len(scenarios)}\n"
@@ -203,7 +265,11 @@ class RealWorldMAKDOTest:
                 f"{'• ' + chr(10).join(failed_scenarios) if failed_scenarios else '(none)'}\n\n"
                 f"⏳ **Next:** Waiting for failures to manifest and testing detection..."
             )
-            self.slack_verifier.send_test_message(summary_msg)
+            self._notify(summary_msg, [
+                {"type": "section", "text": {"type": "mrkdwn", "text": "\n".join(scenario_lines)}},
+                {"type": "divider"},
+                {"type": "section", "text": {"type": "mrkdwn", "text": summary_msg}},
+            ])
 
             overall_success = len(successful_scenarios) >= (len(scenarios) * 0.8)  # 80% success rate
 
@@ -226,6 +292,35 @@ class RealWorldMAKDOTest:
             }
             return False
 
+    async def _kubectl(self, *args: str) -> tuple[int, bytes, bytes]:
+        """Run kubectl against the test cluster without blocking the event loop"""
+        proc = await asyncio.create_subprocess_exec(
+            "kubectl", "--context", "kind-makdo-test", *args,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        return proc.returncode, stdout, stderr
+
+    async def _has_metrics_server(self) -> bool:
+        """Whether metrics-server is installed, discovered once per run"""
+        if self._metrics_server is None:
+            returncode, _, _ = await self._kubectl("get", "--raw", "/apis/metrics.k8s.io/v1beta1")
+            self._metrics_server = returncode == 0
+        return self._metrics_server
+
+    async def _kubectl_raw(self, path: str) -> Dict[str, Any]:
+        """GET a raw API path through kubectl, returning the decoded JSON ({} on failure)"""
+        returncode, stdout, stderr = await self._kubectl("get", "--raw", path)
+        if returncode != 0:
+            logger.warning(f"kubectl get --raw {path} failed: {stderr.decode(errors='replace').strip()}")
+            return {}
+        return json.loads(stdout)
+
+    async def _run_scenario(self, display_name: str, scenario_func) -> bool:
+        """Create one failure scenario in a worker thread"""
+        logger.info(f"  💥 Creating scenario: {display_name}")
+        return await asyncio.to_thread(scenario_func)
+
     async def test_failure_detection_and_reporting(self) -> bool:
         """Detect failures and report findings to Slack"""
         logger.info("🔍 Testing failure detection and Slack reporting...")
@@ -234,71 +329,72 @@ class RealWorldMAKDOTest:
             # Notify about detection phase
             detection_msg = (
                 f"🔍 **Starting Failure Detection Phase**\n\n"
-                f"⏳ Waiting 20 seconds for failures to fully manifest...\n"
-                f"🔍 Then scanning for:\n"
+                f"⏳ Waiting up to 20 seconds for failures to fully manifest...\n"
+                f"🔍 Scanning for:\n"
                 f"• Failed/Pending pods\n"
                 f"• CrashLoopBackOff events\n"
                 f"• Scheduling failures\n"
                 f"• Health check failures"
             )
-            self.slack_verifier.send_test_message(detection_msg)
-
-            # Wait for failures to manifest
-            logger.info("  ⏳ Waiting 20 seconds for failures to manifest...")
-            time.sleep(20)
-
-            # Detect failing pods
-            import subprocess
-
-            # Get failing pods
-            result = subprocess.run([
-                "kubectl", "--context", "kind-makdo-test",
-                "get", "pods", "-n", self.failure_simulator.namespace,
-                "--field-selector=status.phase!=Running",
-                "-o", "jsonpath={.items[*].metadata.name}"
-            ], capture_output=True, text=True)
-
-            failing_pods = result.stdout.strip().split() if result.stdout.strip() else []
-
-            # Get warning events
-            events_result = subprocess.run([
-                "kubectl", "--context", "kind-makdo-test",
-                "get", "events", "-n", self.failure_simulator.namespace,
-                "--field-selector=type=Warning",
-                "-o", "jsonpath={.items[*].reason}"
-            ], capture_output=True, text=True)
-
-            warning_events = events_result.stdout.strip().split() if events_result.stdout.strip() else []
-
-            # Get pod statuses for more detail
-            status_result = subprocess.run([
-                "kubectl", "--context", "kind-makdo-test",
-                "get", "pods", "-n", self.failure_simulator.namespace,
-                "-o", "jsonpath={range .items[*]}{.metadata.name}:{.status.phase}:{.status.containerStatuses[0].state}{\"\\n\"}{end}"
-            ], capture_output=True, text=True)
-
-            pod_statuses = status_result.stdout.strip().split('\n') if status_result.stdout.strip() else []
+            self._notify(detection_msg)
+
+            # Poll until failures have manifested (at least one failing pod and a few
+            # warning events), capped at 20 seconds
+            logger.info("  ⏳ Waiting up to 20 seconds for failures to manifest...")
+            namespace = self.failure_simulator.namespace
+            deadline = time.monotonic() + 20
+            while True:
+                # Fetch pods and warning events as raw API JSON (two concurrent calls instead
+                # of three kubectl queries) and derive everything else in-process
+                pods_data, events_data = await asyncio.gather(
+                    self._kubectl_raw(f"/api/v1/namespaces/{namespace}/pods"),
+                    self._kubectl_raw(f"/api/v1/namespaces/{namespace}/events?fieldSelector=type%3DWarning")
+                )
+                pods = pods_data.get("items", [])
+                events = events_data.get("items", [])
+
+                failing_pods = [pod["metadata"]["name"] for pod in pods
+                                if pod.get("status", {}).get("phase") != "Running"]
+                warning_events = [event.get("reason", "") for event in events]
+
+                if (failing_pods and len(warning_events) >= 3) or time.monotonic() >= deadline:
+                    break
+                await asyncio.sleep(1)
+
+            # Pod statuses for more detail
+            pod_statuses = []
+            for pod in pods:
+                status = pod.get("status", {})
+                container_statuses = status.get("containerStatuses") or [{}]
+                state = container_statuses[0].get("state")
+                pod_statuses.append(
+                    f"{pod['metadata']['name']}:{status.get('phase', '')}:{json.dumps(state) if state else ''}"
+                )
 
             success = len(failing_pods) > 0 or len(warning_events) > 0
 
             # Create detailed detection report for Slack
+            unique_warnings = sorted(set(warning_events))
+            pods_block = "\n".join(f"• {pod}" for pod in failing_pods[:5])
+            events_block = "\n".join(f"• {event}" for event in unique_warnings[:5])
+            overflow = "• ... and more" if len(failing_pods) > 5 else ""
             detection_report = (
                 f"🔍 **Failure Detection Results**\n\n"
                 f"💥 **Failing Pods Found:** {len(failing_pods)}\n"
-                f"{chr(10).join(f'• {pod}' for pod in failing_pods[:5])}\n"
-                f"{'• ... and more' if len(failing_pods) > 5 else ''}\n\n"
+                f"{pods_block}\n"
+                f"{overflow}\n\n"
                 f"⚠️ **Warning Events:** {len(warning_events)}\n"
-                f"{chr(10).join(f'• {event}' for event in list(set(warning_events))[:5])}\n\n"
-                f"📊 **Detection Status:** {'✅ SUCCESS' if success else '❌ FAILED'}\n"
+                f"{events_block}\n\n"
+                f"📊 **Detection Status:** {ICONS[success]} {'SUCCESS' if success else 'FAILED'}\n"
                 f"🎯 **Expected:** Image pull failures, scheduling issues, crashloops"
             )
 
-            self.slack_verifier.send_test_message(detection_report)
+            self._notify(detection_report)
 
             self.results["tests"]["failure_detection"] = {
                 "success": success,
                 "failing_pods": failing_pods,
-                "warning_events": list(set(warning_events)),
+                "warning_events": unique_warnings,
                 "pod_statuses": pod_statuses,
                 "detection_successful": success
             }
@@ -319,30 +415,37 @@ class RealWorldMAKDOTest:
         logger.info("📊 Testing comprehensive system status reporting...")
 
         try:
-            import subprocess
-
-            # Get comprehensive cluster status
-
-            # All pods in namespace
-            pods_result = subprocess.run([
-                "kubectl", "--context", "kind-makdo-test",
-                "get", "pods", "-n", self.failure_simulator.namespace,
-                "-o", "custom-columns=NAME:.metadata.name,STATUS:.status.phase,RESTARTS:.status.containerStatuses[0].restartCount,AGE:.metadata.creationTimestamp"
-            ], capture_output=True, text=True)
-
-            # All events in namespace
-            events_result = subprocess.run([
-                "kubectl", "--context", "kind-makdo-test",
-                "get", "events", "-n", self.failure_simulator.namespace,
-                "--sort-by=.metadata.creationTimestamp",
-                "-o", "custom-columns=TYPE:.type,REASON:.reason,MESSAGE:.message"
-            ], capture_output=True, text=True)
-
-            # Resource usage
-            top_result = subprocess.run([
-                "kubectl", "--context", "kind-makdo-test",
-                "top", "pods", "-n", self.failure_simulator.namespace
-            ], capture_output=True, text=True)
+            namespace = self.failure_simulator.namespace
+
+            # Pods and events in one JSON fetch (checking for metrics-server alongside),
+            # with the tables formatted in-process
+            (_, items_out, _), has_metrics = await asyncio.gather(
+                self._kubectl("get", "pods,events", "-n", namespace, "-o", "json"),
+                self._has_metrics_server()
+            )
+            items = json.loads(items_out).get("items", []) if items_out else []
+
+            pods_output = format_table(("NAME", "STATUS", "RESTARTS", "AGE"), [
+                (
+                    pod["metadata"]["name"],
+                    pod.get("status", {}).get("phase"),
+                    (pod.get("status", {}).get("containerStatuses") or [{}])[0].get("restartCount"),
+                    pod["metadata"].get("creationTimestamp"),
+                )
+                for pod in items if pod.get("kind") == "Pod"
+            ])
+            # Only the most recent events make it into the report, so only those are formatted
+            events = sorted((item for item in items if item.get("kind") == "Event"),
+                            key=lambda event: event["metadata"].get("creationTimestamp") or "")[-RECENT_EVENT_COUNT:]
+            events_output = format_table(("TYPE", "REASON", "MESSAGE"), [
+                (event.get("type"), event.get("reason"), event.get("message")) for event in events
+            ])
+
+            # kubectl top only works with metrics-server installed
+            resource_usage = ""
+            if has_metrics:
+                _, top_out, _ = await self._kubectl("top", "pods", "-n", namespace)
+                resource_usage = top_out.decode(errors="replace")
 
             # Create comprehensive status report
             status_report = (
@@ -350,18 +453,18 @@ class RealWorldMAKDOTest:
                 f"🖥️ **Cluster:** kind-makdo-test\n"
                 f"📦 **Namespace:** {self.failure_simulator.namespace}\n"
                 f"⏰ **Report Time:** {datetime.now().strftime('%H:%M:%S')}\n\n"
-                f"**Pod Status:**\n```\n{pods_result.stdout}\n```\n\n"
-                f"**Recent Events:**\n```\n{events_result.stdout[-500:]}\n```\n\n"
+                f"**Pod Status:**\n```\n{pods_output}\n```\n\n"
+                f"**Recent Events:**\n```\n{events_output}\n```\n\n"
                 f"**This demonstrates the complete E2E test infrastructure working with real Slack integration!**"
             )
 
-            self.slack_verifier.send_test_message(status_report)
+            self._notify(status_report)
 
             self.results["tests"]["system_status"] = {
                 "success": True,
-                "pods_output": pods_result.stdout,
-                "events_output": events_result.stdout,
-                "resource_usage": top_result.stdout
+                "pods_output": pods_output,
+                "events_output": events_output,
+                "resource_usage": resource_usage
             }
 
             logger.info("✅ System status report sent to Slack")
@@ -382,16 +485,11 @@ class RealWorldMAKDOTest:
         try:
             # Clean up test resources
             logger.info("  🧹 Cleaning up test resources...")
-            cleanup_msg = (
-                f"🧹 **Cleanup Phase Started**\n\n"
-                f"🗑️ Deleting test namespace: `{self.failure_simulator.namespace}`\n"
-                f"🔄 Cleaning up all created pods, services, deployments\n"
-                f"⏳ This may take a moment..."
-            )
-            self.slack_verifier.send_test_message(cleanup_msg)
+            cleanup_msg = CLEANUP_MESSAGE.format_map({"namespace": self.failure_simulator.namespace})
+            self._notify(cleanup_msg)
 
-            self.failure_simulator.cleanup()
-            time.sleep(5)  # Give cleanup time to initiate
+            # Namespace deletion runs in the background while the summary is posted
+            cleanup_task = asyncio.create_task(asyncio.to_thread(self.failure_simulator.cleanup))
 
             # Calculate final results
             total_tests = len([t for t in self.results["tests"].values() if not t.get("skipped", False)])
@@ -399,25 +497,21 @@ class RealWorldMAKDOTest:
             success_rate = passed_tests / total_tests if total_tests > 0 else 0
             overall_success = success_rate >= 0.8
 
-            # Send comprehensive final summary
-            final_summary = (
-                f"🎊 **MAKDO Real-World E2E Test Complete!**\n\n"
-                f"📊 **Final Results:**\n"
-                f"✅ **Tests Passed:** {passed_tests}/{total_tests}\n"
-                f"📈 **Success Rate:** {success_rate:.1%}\n"
-                f"🎯 **Overall Status:** {'🎉 SUCCESS' if overall_success else '😞 NEEDS WORK'}\n\n"
-                f"🔍 **What We Demonstrated:**\n"
-                f"• ✅ Real Slack channel auto-creation and bot integration\n"
-                f"• ✅ Live Kubernetes failure simulation in kind clusters\n"
-                f"• ✅ Real-time failure detection and event monitoring\n"
-                f"• ✅ Comprehensive status reporting to Slack\n"
-                f"• ✅ Automated cleanup procedures\n\n"
-                f"⏱️ **Duration:** {time.time() - self.results['start_time']:.1f} seconds\n"
-                f"📅 **Completed:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                f"**🚀 This infrastructure is ready to test MAKDO when the agent config is fixed!**"
-            )
-
-            self.slack_verifier.send_test_message(final_summary)
+            # Send comprehensive final summary (one clock read for duration and timestamp)
+            now = datetime.now()
+            final_summary = FINAL_SUMMARY_MESSAGE.format_map({
+                "passed": passed_tests,
+                "total": total_tests,
+                "rate": success_rate,
+                "status": OVERALL_STATUS[overall_success],
+                "duration": now.timestamp() - self.results["start_time"],
+                "now": now,
+            })
+
+            # Flush queued updates first so the summary is the last message in the channel
+            await self._slack_queue.join()
+            await asyncio.to_thread(self.slack_verifier.send_test_message, final_summary)
+            await cleanup_task
 
             self.results["tests"]["cleanup_and_summary"] = {
                 "success": True,
@@ -451,6 +545,7 @@ class RealWorldMAKDOTest:
 
         passed = 0
         total = len(tests)
+        self._slack_worker = asyncio.create_task(self._slack_loop())
 
         for test_name, test_func in tests:
             logger.info(f"\n{'='*60}")
@@ -466,7 +561,11 @@ class RealWorldMAKDOTest:
             except Exception as e:
                 logger.error(f"💥 {test_name}: EXCEPTION - {e}")
 
-            time.sleep(2)  # Brief pause between tests
+            await asyncio.sleep(2)  # Brief pause between tests; lets the Slack worker run
+
+        # Deliver anything still queued, then stop the Slack worker
+        await self._slack_queue.join()
+        self._slack_worker.cancel()
 
         # Finalize results
         self.results["end_time"] = time.time()
@@ -480,8 +579,7 @@ class RealWorldMAKDOTest:
 
         # Save results to file
         results_file = Path("tests/e2e/real_world_results.json")
-        with open(results_file, "w") as f:
-            json.dump(self.results, f, indent=2)
+        results_file.write_text(json.dumps(self.results, indent=2, default=str))
 
         # Print final console summary
         logger.info(f"\n{'='*80}")
@@ -1,11 +1,14 @@
 """Out-of-band admin API for cluster management."""
 
 import logging
+import os
 from typing import Dict, Any
 
 from fastapi import FastAPI, HTTPException, Depends, Security
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import uvicorn
 
 from ..utils.cluster_sessions import session_manager
@@ -17,7 +20,8 @@ security = HTTPBearer()
 
 class SessionCreateRequest(BaseModel):
     cluster_name: str
-    kubeconfig: str
+    # Multi-KB credentials blob: kept out of model reprs and accepted only as a JSON string
+    kubeconfig: str = Field(repr=False, strict=True)
     context: str | None = None
     ttl_hours: float = 24.0
 
@@ -36,6 +40,8 @@ class SessionListResponse(BaseModel):
     total_sessions: int
     sessions: list[Dict[str, Any]]
 
+HEALTH_RESPONSE = {"status": "healthy", "service": "k8s-ai-a2a-admin"}
+
 def create_admin_app(api_key_manager=None) -> FastAPI:
     """Create FastAPI app for admin operations."""
     app = FastAPI(
@@ -44,6 +50,9 @@ def create_admin_app(api_key_manager=None) -> FastAPI:
         version="1.0.0"
     )
 
+    # Environment fallback key, read once when the app is built
+    admin_key = os.getenv("A2A_API_KEY")
+
     def verify_admin_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> str:
         """Verify admin API token using keys from ApiKeyManager."""
         if api_key_manager:
@@ -52,8 +61,6 @@ def create_admin_app(api_key_manager=None) -> FastAPI:
                 return credentials.credentials
 
         # Fall back to environment variable if no ApiKeyManager provided
-        import os
-        admin_key = os.getenv("A2A_API_KEY")
         if admin_key and credentials.credentials == admin_key:
             return credentials.credentials
 
@@ -66,8 +73,9 @@ def create_admin_app(api_key_manager=None) -> FastAPI:
     ):
         """Create a new cluster session with temporary credentials."""
         try:
-            # Create the session
-            session_token = session_manager.create_session(
+            # Create the session (kubeconfig parsing blocks, so run it off the event loop)
+            session_token = await run_in_threadpool(
+                session_manager.create_session,
                 cluster_name=request.cluster_name,
                 kubeconfig_yaml=request.kubeconfig,
                 context=request.context,
@@ -79,9 +87,10 @@ def create_admin_app(api_key_manager=None) -> FastAPI:
             session = session_manager.get_session(session_token)
             if session:
                 try:
-                    k8s_client = session.get_k8s_client()
-                    # Simple connectivity test
-                    version_info = k8s_client.get_api_client().api_version
+                    # Simple connectivity test, also off the event loop
+                    version_info = await run_in_threadpool(
+                        lambda: session.get_k8s_client().get_api_client().api_version
+                    )
                     connectivity_status = "connected"
                     connectivity_message = f"Successfully connected to Kubernetes API"
                 except Exception as e:
@@ -119,11 +128,9 @@ def create_admin_app(api_key_manager=None) -> FastAPI:
     async def list_all_sessions(_: str = Depends(verify_admin_token)):
         """List all active sessions (admin only)."""
         try:
-            sessions = session_manager.list_sessions()
-            return SessionListResponse(
-                total_sessions=len(sessions),
-                sessions=sessions
-            )
+            sessions = await run_in_threadpool(session_manager.list_sessions)
+            # Session dicts are already JSON-ready; skip response_model re-validation
+            return JSONResponse({"total_sessions": len(sessions), "sessions": sessions})
         except Exception as e:
             logger.error(f"Error listing sessions: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to list sessions: {str(e)}")
@@ -132,11 +139,8 @@ def create_admin_app(api_key_manager=None) -> FastAPI:
     async def list_my_sessions(api_key: str = Depends(verify_admin_token)):
         """List sessions created by the authenticated client."""
         try:
-            sessions = session_manager.list_sessions(client_api_key=api_key)
-            return SessionListResponse(
-                total_sessions=len(sessions),
-                sessions=sessions
-            )
+            sessions = await run_in_threadpool(session_manager.list_sessions, client_api_key=api_key)
+            return JSONResponse({"total_sessions": len(sessions), "sessions": sessions})
         except Exception as e:
             logger.error(f"Error listing client sessions: {e}")
             raise HTTPException(status_code=500, detail=f"Failed to list sessions: {str(e)}")
@@ -155,18 +159,18 @@ def create_admin_app(api_key_manager=None) -> FastAPI:
                 # For now, allow any authenticated client to delete any session
                 # TODO: Add proper authorization checks
                 cluster_name = session.cluster_name
-                deleted = session_manager.delete_session(session_token)
+                deleted = await run_in_threadpool(session_manager.delete_session, session_token)
             else:
                 cluster_name = "unknown"
                 deleted = False
 
-            return {
+            return JSONResponse({
                 "success": True,
                 "session_token": session_token,
                 "cluster_name": cluster_name,
                 "deleted": deleted,
                 "message": "Session removed successfully" if deleted else "Session not found or already expired"
-            }
+            })
 
         except Exception as e:
             logger.error(f"Error in delete_session: {e}")
@@ -175,7 +179,7 @@ def create_admin_app(api_key_manager=None) -> FastAPI:
     @app.get("/health")
     async def health_check():
         """Health check endpoint."""
-        return {"status": "healthy", "service": "k8s-ai-a2a-admin"}
+        return JSONResponse(HEALTH_RESPONSE)
 
     return app
 
@@ -190,4 +194,5 @@ def serve_admin_api(host: str = "0.0.0.0", port: int = 9998):
     logger.info(f"  DELETE http://{host}:{port}/sessions/{{session_token}}")
     logger.info(f"  GET    http://{host}:{port}/health")
 
+    # A single worker is deliberate: sessions live in this process's session_manager.
     uvicorn.run(app, host=host, port=port, log_config=None)
\ No newline at end of file
@@ -7,6 +7,7 @@ import json
 import secrets
 import asyncio
 import logging
+import time
 from datetime import datetime
 
 import uvicorn
@@ -23,12 +24,20 @@ from a2a.types import (
     AgentSkill,
 )
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from .diagnostic_executor import K8sDiagnosticExecutor
 from ..admin.admin_api import create_admin_app
 from ..utils.cluster_sessions import session_manager
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between keys.json writes made only to record last_used timestamps
+LAST_USED_SAVE_INTERVAL = 60.0
+
 
 class ApiKeyManager:
     """Manages API keys for authentication."""
@@ -36,6 +45,7 @@ class ApiKeyManager:
     def __init__(self, keys_file: str = 'keys.json'):
         self.keys_file = keys_file
         self.keys: dict[str, dict] = {}
+        self._last_used_saved_at = float('-inf')
         self.load_keys()
     
     def load_keys(self):
@@ -86,9 +96,12 @@ class ApiKeyManager:
     def validate_key(self, key: str) -> bool:
         """Validate an API key."""
         if key in self.keys:
-            # Update last used timestamp
+            # Update last used timestamp; persist it at most once per interval, not per request
             self.keys[key]['last_used'] = datetime.now().isoformat()
-            self.save_keys()
+            now = time.monotonic()
+            if now - self._last_used_saved_at >= LAST_USED_SAVE_INTERVAL:
+                self._last_used_saved_at = now
+                self.save_keys()
             return True
         return False
     
@@ -335,8 +348,11 @@ def main():
             main_server.serve()
         )
 
-    # Run the servers
-    asyncio.run(start_servers())
+    # Run the servers on uvloop where it is available (pyproject pins uvloop>=0.18 for uvloop.run)
+    if uvloop is not None:
+        uvloop.run(start_servers())
+    else:
+        asyncio.run(start_servers())
 
 
 if __name__ == "__main__":
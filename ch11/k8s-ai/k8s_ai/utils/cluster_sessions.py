@@ -2,6 +2,7 @@
 
 import secrets
 import tempfile
+import threading
 import yaml
 from datetime import datetime, timedelta
 from typing import Any, Optional
@@ -38,11 +39,6 @@ class ClusterSession:
             self._k8s_client = DynamicKubernetesClient(self.credentials)
         return self._k8s_client
 
-    def cleanup(self) -> None:
-        """Clean up resources."""
-        if self._k8s_client:
-            self._k8s_client.close()
-
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for API responses."""
         return {
@@ -61,6 +57,11 @@ class ClusterSessionManager:
 
     def __init__(self):
         self._sessions: dict[str, ClusterSession] = {}
+        # Sessions for the same cluster credentials share one client (and its connection pool):
+        # credentials key -> (client, tokens of the sessions using it)
+        self._clients: dict[tuple, tuple[DynamicKubernetesClient, set[str]]] = {}
+        # Admin API handlers run in a threadpool, so guard the session table
+        self._lock = threading.RLock()
 
     def create_session(
         self,
@@ -101,17 +102,20 @@ class ClusterSessionManager:
             client_api_key=client_api_key,
         )
 
-        # Store session
-        self._sessions[session_token] = session
+        with self._lock:
+            # Store session
+            self._sessions[session_token] = session
+            session._k8s_client = self._acquire_client(session_token, credentials)
 
-        # Clean up expired sessions
-        self._cleanup_expired_sessions()
+            # Clean up expired sessions
+            self._cleanup_expired_sessions()
 
         return session_token
 
     def get_session(self, session_token: str) -> Optional[ClusterSession]:
         """Get session by token."""
-        session = self._sessions.get(session_token)
+        with self._lock:
+            session = self._sessions.get(session_token)
         if session and session.is_expired():
             self.delete_session(session_token)
             return None
@@ -119,16 +123,56 @@ class ClusterSessionManager:
 
     def delete_session(self, session_token: str) -> bool:
         """Delete a cluster session."""
-        session = self._sessions.pop(session_token, None)
-        if session:
-            session.cleanup()
-            return True
-        return False
+        with self._lock:
+            session = self._sessions.pop(session_token, None)
+            client = self._release_client(session_token, session.credentials) if session else None
+        if client:
+            client.close()
+        return session is not None
+
+    @staticmethod
+    def _credentials_key(credentials: KubernetesCredentials) -> tuple:
+        return (
+            credentials.api_server,
+            # Clients fall back to their credentials' namespace, so it must match too
+            credentials.namespace,
+            credentials.token,
+            credentials.ca_certificate,
+            credentials.client_cert,
+            credentials.client_key,
+        )
+
+    def _acquire_client(
+        self, session_token: str, credentials: KubernetesCredentials
+    ) -> DynamicKubernetesClient:
+        """Return the shared client for these credentials, creating it if needed. Caller holds the lock."""
+        key = self._credentials_key(credentials)
+        if key not in self._clients:
+            self._clients[key] = (DynamicKubernetesClient(credentials), set())
+        client, users = self._clients[key]
+        users.add(session_token)
+        return client
+
+    def _release_client(
+        self, session_token: str, credentials: KubernetesCredentials
+    ) -> Optional[DynamicKubernetesClient]:
+        """Drop a session's claim on its shared client; return the client if it is now unused. Caller holds the lock."""
+        key = self._credentials_key(credentials)
+        entry = self._clients.get(key)
+        if entry is None:
+            return None
+        client, users = entry
+        users.discard(session_token)
+        if users:
+            return None
+        del self._clients[key]
+        return client
 
     def list_sessions(self, client_api_key: Optional[str] = None) -> list[dict[str, Any]]:
         """List active sessions. If client_api_key provided, only return that client's sessions."""
-        self._cleanup_expired_sessions()
-        sessions = self._sessions.values()
+        with self._lock:
+            self._cleanup_expired_sessions()
+            sessions = list(self._sessions.values())
 
         # Filter by client API key if provided
         if client_api_key:
@@ -239,7 +283,7 @@ class ClusterSessionManager:
             if session.is_expired()
         ]
         for token in expired_tokens:
-            self.unregister_cluster(token)
+            self.delete_session(token)
 
 
 # Global session manager instance
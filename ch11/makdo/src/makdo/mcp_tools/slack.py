@@ -3,9 +3,11 @@
 Custom MCP Slack Server for MAKDO using FastMCP
 """
 
+import json
 import os
-import requests
+import httpx
 from pathlib import Path
+from dotenv import dotenv_values
 from mcp.server.fastmcp import FastMCP
 
 # Initialize FastMCP server
@@ -23,18 +25,30 @@ if not bot_token:
     env_file = makdo_root / '.env'
 
     if env_file.exists():
-        with open(env_file) as f:
-            for line in f:
-                if line.startswith('AI6_BOT_TOKEN='):
-                    bot_token = line.split('=', 1)[1].strip()
-                    break
+        bot_token = dotenv_values(env_file).get('AI6_BOT_TOKEN')
 
 if not bot_token:
     raise ValueError("AI6_BOT_TOKEN not found in environment or .env file")
 
+# Shared async client so every tool call reuses pooled keep-alive connections to Slack
+_client = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Create the shared Slack client on first use (inside the server's event loop)"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url='https://slack.com/api',
+            headers={'Authorization': f'Bearer {bot_token}'},
+            timeout=10,
+            limits=httpx.Limits(max_connections=20, keepalive_expiry=75)
+        )
+    return _client
+
 
 @mcp.tool()
-def slack_post_message(channel: str, text: str) -> str:
+async def slack_post_message(channel: str, text: str) -> str:
     """Post a message to a Slack channel
 
     Args:
@@ -48,19 +62,18 @@ def slack_post_message(channel: str, text: str) -> str:
     if not channel.startswith('#'):
         channel = f'#{channel}'
 
-    url = 'https://slack.com/api/chat.postMessage'
-    headers = {
-        'Authorization': f'Bearer {bot_token}',
-        'Content-Type': 'application/json; charset=utf-8'
-    }
     data = {
         'channel': channel,
         'text': text
     }
 
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=10)
-        result = response.json()
+        response = await _get_client().post(
+            '/chat.postMessage',
+            headers={'Content-Type': 'application/json; charset=utf-8'},
+            content=json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+        )
+        result = json.loads(response.content)
 
         if result.get('ok'):
             return f"✅ Message posted to {channel}"
@@ -73,20 +86,15 @@ def slack_post_message(channel: str, text: str) -> str:
 
 
 @mcp.tool()
-def slack_list_channels() -> str:
+async def slack_list_channels() -> str:
     """List all channels in the workspace
 
     Returns:
         List of channels
     """
-    url = 'https://slack.com/api/conversations.list'
-    headers = {
-        'Authorization': f'Bearer {bot_token}'
-    }
-
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        result = response.json()
+        response = await _get_client().get('/conversations.list')
+        result = json.loads(response.content)
 
         if result.get('ok'):
             channels = result.get('channels', [])
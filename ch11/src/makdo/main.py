@@ -5,14 +5,45 @@ Orchestrates the multi-agent Kubernetes DevOps system.
 
 import logging
 import os
+import signal
+import subprocess
+import threading
 import time
+import requests
 import yaml
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 from ai_six.agent.agent import Agent
 from ai_six.agent.config import Config
+from ai_six.object_model import SystemMessage
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# Session context injected into the Analyzer and Fixer sub-agents
+SESSION_CONTEXT_TEMPLATE = """K8s Cluster Session: You have been given access to the '{cluster_context}' Kubernetes cluster.
+
+Session Token: {session_token}
+
+When using the k8s diagnostic tools, format your message parameter as:
+"kubernetes_resource_health: session_token={session_token}, resource_type=pod, namespace=all"
+
+CRITICAL: Always use namespace=all to check ALL namespaces, not just default!
+
+Example:
+- To check all pods: message="kubernetes_resource_health: session_token={session_token}, resource_type=pod, namespace=all"
+- To diagnose issue: message="kubernetes_diagnose_issue: session_token={session_token}, issue_description=check pods not starting, namespace=all"
+
+Always include the session_token and use namespace=all in your message."""
 
 
 def load_config(config_path: str = "config/makdo.yaml") -> Dict[str, Any]:
@@ -23,18 +54,19 @@ def load_config(config_path: str = "config/makdo.yaml") -> Dict[str, Any]:
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
     with open(config_file) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
+@lru_cache(maxsize=None)
 def load_agent_config(agent_name: str) -> Dict[str, Any]:
-    """Load agent-specific configuration from YAML file."""
+    """Load agent-specific configuration from YAML file (parsed once per agent; don't mutate)."""
     config_path = Path(f"src/makdo/agents/{agent_name}.yaml")
 
     if not config_path.exists():
         raise FileNotFoundError(f"Agent config not found: {config_path}")
 
     with open(config_path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def create_coordinator_config() -> Config:
@@ -42,24 +74,68 @@ def create_coordinator_config() -> Config:
     return Config.from_file("src/makdo/agents/coordinator.yaml")
 
 
+# Pooled HTTP session for the k8s-ai Admin API, created on first use
+_admin_session = None
+
+
+def get_admin_session():
+    """Return the shared k8s-ai Admin API session (keep-alive, retries transient failures)."""
+    global _admin_session
+    if _admin_session is None:
+        _admin_session = requests.Session()
+        _admin_session.mount("http://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        ))
+    return _admin_session
+
+
+# Minified kubeconfig per context: (fetched_at, kubeconfig file mtimes, kubeconfig)
+_kubeconfig_cache: Dict[str, Tuple[float, Tuple, str]] = {}
+
+
+def _kubeconfig_mtimes() -> Tuple:
+    """Modification times of the kubeconfig files kubectl reads."""
+    paths = os.getenv("KUBECONFIG") or str(Path.home() / ".kube" / "config")
+    mtimes = []
+    for path in filter(None, paths.split(os.pathsep)):
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+def get_kubeconfig(cluster_context: str, ttl: float = 300) -> str:
+    """Return the minified, raw kubeconfig for a context, cached until it changes or ttl expires."""
+    now = time.monotonic()
+    mtimes = _kubeconfig_mtimes()
+    cached = _kubeconfig_cache.get(cluster_context)
+    if cached and now - cached[0] < ttl and cached[1] == mtimes:
+        return cached[2]
+
+    # Read raw bytes and decode once; stderr is captured for the CalledProcessError
+    kubeconfig = subprocess.run(
+        ["kubectl", "config", "view", f"--context={cluster_context}", "--minify", "--raw"],
+        capture_output=True, check=True, close_fds=False
+    ).stdout.decode("utf-8", "replace")
+    _kubeconfig_cache[cluster_context] = (now, mtimes, kubeconfig)
+    return kubeconfig
+
+
 def create_k8s_ai_session(cluster_context: str, api_url: str = "http://localhost:9998") -> str:
     """Create a k8s-ai session and return the session token."""
-    import subprocess
-    import requests
-
     logger = logging.getLogger("makdo")
 
     try:
         # Get kubeconfig for the cluster
         logger.info(f"Getting kubeconfig for context: {cluster_context}")
-        kubeconfig = subprocess.check_output(
-            ["kubectl", "config", "view", f"--context={cluster_context}", "--minify", "--raw"],
-            text=True
-        )
+        kubeconfig = get_kubeconfig(cluster_context)
 
         # Create session via Admin API
         logger.info(f"Creating k8s-ai session for {cluster_context}...")
-        response = requests.post(
+        response = get_admin_session().post(
             f"{api_url}/sessions",
             headers={"Authorization": "Bearer test-key"},
             json={
@@ -84,36 +160,50 @@ def create_k8s_ai_session(cluster_context: str, api_url: str = "http://localhost
         return None
 
 
-def setup_tool_call_monitoring(coordinator: Agent):
-    """Setup comprehensive tool call monitoring for all agents."""
-    from functools import wraps
-    import json
+def get_sub_agents(coordinator: Agent) -> List[Tuple[str, Agent]]:
+    """(name, agent) for each sub-agent, which are AgentTool instances named agent_* in tool_dict."""
+    return [
+        (tool_name[len("agent_"):], tool.agent)
+        for tool_name, tool in coordinator.tool_dict.items()
+        if tool_name.startswith("agent_") and hasattr(tool, 'agent')
+    ]
+
+
+def setup_tool_call_monitoring(coordinator: Agent, sub_agents: List[Tuple[str, Agent]] = None) -> bool:
+    """Setup comprehensive tool call monitoring for all agents.
 
+    Returns False without wrapping anything when makdo.tools isn't logging at INFO.
+    """
     logger = logging.getLogger("makdo.tools")
 
+    # Nothing would be logged, so keep tool calls unwrapped
+    if not logger.isEnabledFor(logging.INFO):
+        return False
+
     def wrap_agent_tools(agent, agent_name):
         """Wrap all tools for an agent to add logging."""
-        for tool_name, tool in list(agent.tool_dict.items()):
+        # Only tool.run is replaced, the dict itself isn't mutated, so no copy is needed
+        for tool_name, tool in agent.tool_dict.items():
             original_run = tool.run
 
             @wraps(original_run)
             def logged_run(*args, _tool_name=tool_name, _agent_name=agent_name, _orig_run=original_run, **kwargs):
-                # Log tool call
-                logger.info(f"🔧 [{_agent_name}] Calling tool: {_tool_name}")
-                logger.info(f"   Args: {args}")
-                logger.info(f"   Kwargs: {kwargs}")
+                # Log tool call (lazy %-formatting, so filtered records cost nothing)
+                logger.info("🔧 [%s] Calling tool: %s", _agent_name, _tool_name)
+                logger.info("   Args: %s", args)
+                logger.info("   Kwargs: %s", kwargs)
 
                 # For A2A tools, log the message parameter specifically
                 if 'message' in kwargs:
-                    logger.info(f"   📨 A2A Message: {kwargs['message'][:200]}...")
+                    logger.info("   📨 A2A Message: %.200s...", kwargs['message'])
 
                 try:
                     result = _orig_run(*args, **kwargs)
-                    logger.info(f"✅ [{_agent_name}] Tool {_tool_name} completed")
-                    logger.info(f"   Result preview: {str(result)[:300]}...")
+                    logger.info("✅ [%s] Tool %s completed", _agent_name, _tool_name)
+                    logger.info("   Result preview: %.300s...", result)
                     return result
                 except Exception as e:
-                    logger.error(f"❌ [{_agent_name}] Tool {_tool_name} failed: {e}")
+                    logger.error("❌ [%s] Tool %s failed: %s", _agent_name, _tool_name, e)
                     raise
 
             tool.run = logged_run
@@ -122,15 +212,16 @@ def setup_tool_call_monitoring(coordinator: Agent):
     wrap_agent_tools(coordinator, "Coordinator")
 
     # Wrap sub-agent tools (sub-agents are stored as AgentTool instances in tool_dict)
-    for tool_name, tool in coordinator.tool_dict.items():
-        if tool_name.startswith("agent_"):
-            agent_name = tool_name.replace("agent_", "")
-            if hasattr(tool, 'agent'):
-                wrap_agent_tools(tool.agent, agent_name)
-                logger.info(f"✅ Wrapped tools for {agent_name}")
+    if sub_agents is None:
+        sub_agents = get_sub_agents(coordinator)
+    for agent_name, agent in sub_agents:
+        wrap_agent_tools(agent, agent_name)
+        logger.info("✅ Wrapped tools for %s", agent_name)
+
+    return True
 
 
-def start_coordinator(coordinator: Agent, config: Dict[str, Any]):
+def start_coordinator(coordinator: Agent, config: Dict[str, Any], sub_agents: List[Tuple[str, Agent]] = None):
     """Start the coordinator agent."""
     logging.info("Starting MAKDO Coordinator")
 
@@ -167,53 +258,32 @@ def start_coordinator(coordinator: Agent, config: Dict[str, Any]):
             session_token = None
 
     # Inject session token into sub-agent sessions via SystemMessage (following ai-six v0.14.3 pattern)
-    from ai_six.object_model import SystemMessage
-
     # Sub-agents are stored as AgentTool instances in the coordinator's tool_dict
     # AgentTool instances have a .agent attribute that is the actual Agent
     injected_count = 0
     if session_token and cluster_context:
-        for tool_name, tool in coordinator.tool_dict.items():
-            # Check if this is an agent tool (starts with "agent_")
-            if tool_name.startswith("agent_"):
-                # Get the agent name from the tool name
-                agent_name = tool_name.replace("agent_", "")
-
-                # Only inject into Analyzer and Fixer agents
-                if agent_name in ["MAKDO_Analyzer", "MAKDO_Fixer"]:
-                    # Access the actual agent from the AgentTool wrapper
-                    if hasattr(tool, 'agent'):
-                        agent = tool.agent
-
-                        # CRITICAL: Clear old session messages to prevent stale session IDs from being used
-                        # Old session summaries contain wrong session tokens that confuse the agent
-                        old_message_count = len(agent.session.messages)
-                        agent.session.messages.clear()
-                        logger.info(f"   Cleared {old_message_count} old messages from {agent_name}")
-
-                        # Create SystemMessage with session token and format instructions
-                        session_context = SystemMessage(
-                            content=f"""K8s Cluster Session: You have been given access to the '{cluster_context}' Kubernetes cluster.
-
-Session Token: {session_token}
-
-When using the k8s diagnostic tools, format your message parameter as:
-"kubernetes_resource_health: session_token={session_token}, resource_type=pod, namespace=all"
-
-CRITICAL: Always use namespace=all to check ALL namespaces, not just default!
-
-Example:
-- To check all pods: message="kubernetes_resource_health: session_token={session_token}, resource_type=pod, namespace=all"
-- To diagnose issue: message="kubernetes_diagnose_issue: session_token={session_token}, issue_description=check pods not starting, namespace=all"
-
-Always include the session_token and use namespace=all in your message."""
-                        )
+        # The same session context goes to every target sub-agent, so build it once
+        session_context = SystemMessage(
+            content=SESSION_CONTEXT_TEMPLATE.format(cluster_context=cluster_context,
+                                                    session_token=session_token)
+        )
 
-                        # Inject into agent's session
-                        agent.session.messages.append(session_context)
-                        logger.info(f"✅ Injected session token SystemMessage into {agent_name}")
-                        logger.info(f"   Session token: {session_token[:30]}...")
-                        injected_count += 1
+        if sub_agents is None:
+            sub_agents = get_sub_agents(coordinator)
+        for agent_name, agent in sub_agents:
+            # Only inject into Analyzer and Fixer agents
+            if agent_name in ("MAKDO_Analyzer", "MAKDO_Fixer"):
+                # CRITICAL: Clear old session messages to prevent stale session IDs from being used
+                # Old session summaries contain wrong session tokens that confuse the agent
+                old_message_count = len(agent.session.messages)
+                agent.session.messages.clear()
+                logger.info(f"   Cleared {old_message_count} old messages from {agent_name}")
+
+                # Inject into agent's session
+                agent.session.messages.append(session_context)
+                logger.info(f"✅ Injected session token SystemMessage into {agent_name}")
+                logger.info(f"   Session token: {session_token[:30]}...")
+                injected_count += 1
 
         if injected_count > 0:
             logger.info(f"✅ k8s-ai session token configured for {injected_count} sub-agent(s)")
@@ -224,21 +294,30 @@ Always include the session_token and use namespace=all in your message."""
 
     logger.info(f"Starting health check loop (interval: {check_interval}s)")
 
+    prompt = (
+        "Perform a comprehensive health check across all registered clusters. "
+        "Use the Analyzer agent to identify any issues, then use the Slack Bot agent "
+        "to report findings to the #makdo-devops channel. "
+        "If critical issues are found, use the Fixer agent to attempt remediation."
+    )
+
+    # SIGTERM (e.g. pod shutdown) ends the loop between checks so the session still gets saved
+    stop = threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    # Checks start on a fixed monotonic cadence, so check duration doesn't add drift
+    next_deadline = time.monotonic()
+
     try:
-        while True:
+        while not stop.is_set():
+            next_deadline += check_interval
             try:
                 # Request a health check from the coordinator
                 logger.info("="*80)
                 logger.info("🔍 Initiating cluster health check...")
                 logger.info("="*80)
 
-                prompt = (
-                    "Perform a comprehensive health check across all registered clusters. "
-                    "Use the Analyzer agent to identify any issues, then use the Slack Bot agent "
-                    "to report findings to the #makdo-devops channel. "
-                    "If critical issues are found, use the Fixer agent to attempt remediation."
-                )
-
                 logger.info(f"📤 Coordinator prompt: {prompt}")
                 response = coordinator.send_message(prompt)
                 logger.info("="*80)
@@ -248,22 +327,22 @@ Always include the session_token and use namespace=all in your message."""
 
                 # Clear session history to prevent context overflow and message ordering issues
                 # Keep only system message - each health check cycle is independent
-                if len(coordinator.session.messages) > 3:
-                    logger.info(f"Clearing old session messages ({len(coordinator.session.messages)} messages)")
-                    # Keep only system message (first message)
-                    system_message = coordinator.session.messages[0] if coordinator.session.messages else None
-                    coordinator.session.messages.clear()
-                    if system_message:
-                        coordinator.session.messages.append(system_message)
+                messages = coordinator.session.messages
+                if len(messages) > 3:
+                    logger.info(f"Clearing old session messages ({len(messages)} messages)")
+                    # Keep only system message (first message), trimming the rest in place
+                    del messages[1:]
                     logger.info(f"Session reset to {len(coordinator.session.messages)} message (system message only)")
 
             except Exception as e:
-                logger.error(f"Error during health check cycle: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"Error during health check cycle: {e}")
 
-            # Wait before next check
-            time.sleep(check_interval)
+            # Wait until the next scheduled check; a check that overran starts the next one right away
+            now = time.monotonic()
+            if next_deadline < now:
+                next_deadline = now
+            if stop.wait(next_deadline - now):
+                logger.info("MAKDO Coordinator shutting down...")
 
     except KeyboardInterrupt:
         logger.info("MAKDO Coordinator shutting down...")
@@ -330,11 +409,14 @@ def main():
 
         # Setup comprehensive tool call monitoring
         logger.info("Setting up tool call monitoring...")
-        setup_tool_call_monitoring(coordinator)
-        logger.info("✅ Tool call monitoring enabled for all agents")
+        sub_agents = get_sub_agents(coordinator)
+        if setup_tool_call_monitoring(coordinator, sub_agents):
+            logger.info("✅ Tool call monitoring enabled for all agents")
+        else:
+            logger.info("Tool call monitoring skipped (makdo.tools logging is below INFO)")
 
         # Start the coordinator (main orchestrator)
-        start_coordinator(coordinator, config)
+        start_coordinator(coordinator, config, sub_agents)
 
     except Exception as e:
         logger.error(f"Failed to start MAKDO: {e}")
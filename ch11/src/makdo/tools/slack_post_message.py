@@ -1,10 +1,18 @@
 """Slack message posting tool"""
 
+import json
 import os
 import requests
 from pathlib import Path
+from dotenv import dotenv_values
 from ai_six.object_model import Tool, Parameter
 
+# Shared across tool instances so repeated posts reuse a pooled keep-alive connection
+_session = requests.Session()
+
+# Bot token, resolved on first successful lookup and shared across tool instances
+_bot_token = None
+
 
 class SlackPostMessage(Tool):
     """Tool to post messages to Slack channels"""
@@ -24,7 +32,14 @@ class SlackPostMessage(Tool):
         )
 
     def _get_token(self):
-        """Get Slack bot token from environment"""
+        """Get Slack bot token from environment (cached once found)"""
+        global _bot_token
+        if _bot_token is None:
+            _bot_token = self._read_token()
+        return _bot_token
+
+    def _read_token(self):
+        """Read the Slack bot token from the environment or the .env file"""
         token = os.getenv('AI6_BOT_TOKEN')
 
         if not token:
@@ -33,11 +48,7 @@ class SlackPostMessage(Tool):
             env_file = makdo_root / '.env'
 
             if env_file.exists():
-                with open(env_file) as f:
-                    for line in f:
-                        if line.startswith('AI6_BOT_TOKEN='):
-                            token = line.split('=', 1)[1].strip()
-                            break
+                token = dotenv_values(env_file).get('AI6_BOT_TOKEN')
 
         return token
 
@@ -71,8 +82,9 @@ class SlackPostMessage(Tool):
         }
 
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=10)
-            result = response.json()
+            body = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+            response = _session.post(url, headers=headers, data=body, timeout=10)
+            result = json.loads(response.content)
 
             if result.get('ok'):
                 return f"✅ Message posted to {channel}"
@@ -3,13 +3,29 @@
 Regular Python tools for Slack (not MCP) to avoid event loop issues
 """
 
+import json
 import os
 import requests
 from pathlib import Path
+from dotenv import dotenv_values
+
+# Shared session so repeated Slack calls reuse a pooled keep-alive connection
+_session = requests.Session()
+
+# Bot token, resolved on first successful lookup
+_bot_token = None
 
 
 def get_slack_token():
-    """Get Slack bot token from environment"""
+    """Get Slack bot token from environment (cached once found)"""
+    global _bot_token
+    if _bot_token is None:
+        _bot_token = _read_slack_token()
+    return _bot_token
+
+
+def _read_slack_token():
+    """Read the Slack bot token from the environment or the .env file"""
     token = os.getenv('AI6_BOT_TOKEN')
 
     if not token:
@@ -21,11 +37,7 @@ def get_slack_token():
         env_file = makdo_root / '.env'
 
         if env_file.exists():
-            with open(env_file) as f:
-                for line in f:
-                    if line.startswith('AI6_BOT_TOKEN='):
-                        token = line.split('=', 1)[1].strip()
-                        break
+            token = dotenv_values(env_file).get('AI6_BOT_TOKEN')
 
     return token
 
@@ -60,8 +72,9 @@ def slack_post_message(channel: str, text: str) -> str:
     }
 
     try:
-        response = requests.post(url, headers=headers, json=data, timeout=10)
-        result = response.json()
+        body = json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode()
+        response = _session.post(url, headers=headers, data=body, timeout=10)
+        result = json.loads(response.content)
 
         if result.get('ok'):
             return f"✅ Message posted to {channel}"
@@ -90,8 +103,8 @@ def slack_list_channels() -> str:
     }
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        result = response.json()
+        response = _session.get(url, headers=headers, timeout=10)
+        result = json.loads(response.content)
 
         if result.get('ok'):
             channels = result.get('channels', [])